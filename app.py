@@ -51,6 +51,9 @@ except Exception as e:
     print(f"[ERROR] Error loading model: {e}")
     MODEL_LOADED = False
 
+# Emotion labels in label_mapping order; each has its own probability column
+EMOTION_LABELS = ('sadness', 'joy', 'love', 'anger', 'fear', 'surprise')
+
 
 # Database Models
 class User(db.Model):
@@ -89,8 +92,30 @@ class DiaryEntry(db.Model):
     primary_emotion = db.Column(db.String(50))
     emotion_confidence = db.Column(db.Float)
     sentiment_score = db.Column(db.Float)
-    emotion_probabilities = db.Column(db.Text)
     mood_category = db.Column(db.String(20))
+    # Per-emotion probabilities stored as float32 columns so they can be filtered in SQL
+    prob_sadness = db.Column(db.Float(precision=24))
+    prob_joy = db.Column(db.Float(precision=24))
+    prob_love = db.Column(db.Float(precision=24))
+    prob_anger = db.Column(db.Float(precision=24))
+    prob_fear = db.Column(db.Float(precision=24))
+    prob_surprise = db.Column(db.Float(precision=24))
+
+    @property
+    def emotion_probabilities(self):
+        probs = {}
+        for label in EMOTION_LABELS:
+            value = getattr(self, f'prob_{label}')
+            if value is not None:
+                probs[label] = value
+        return probs
+
+    @emotion_probabilities.setter
+    def emotion_probabilities(self, probs):
+        probs = probs or {}
+        for label in EMOTION_LABELS:
+            value = probs.get(label)
+            setattr(self, f'prob_{label}', float(value) if value is not None else None)
 
     def to_dict(self):
         return {
@@ -102,7 +127,7 @@ class DiaryEntry(db.Model):
             'primary_emotion': self.primary_emotion,
             'emotion_confidence': self.emotion_confidence,
             'sentiment_score': self.sentiment_score,
-            'emotion_probabilities': json.loads(self.emotion_probabilities) if self.emotion_probabilities else {},
+            'emotion_probabilities': self.emotion_probabilities,
             'mood_category': self.mood_category
         }
 
@@ -445,7 +470,7 @@ def create_entry(current_user):
             primary_emotion=emotion,
             emotion_confidence=confidence,
             sentiment_score=sentiment_score,
-            emotion_probabilities=json.dumps(all_probs) if all_probs else '{}',
+            emotion_probabilities=all_probs,
             mood_category=mood_category
         )
 
@@ -485,7 +510,7 @@ def update_entry(current_user, entry_id):
             entry.primary_emotion = emotion
             entry.emotion_confidence = confidence
             entry.sentiment_score = sentiment_score
-            entry.emotion_probabilities = json.dumps(all_probs) if all_probs else '{}'
+            entry.emotion_probabilities = all_probs
             entry.mood_category = mood_category
 
         entry.updated_at = datetime.utcnow()
@@ -650,6 +675,40 @@ with app.app_context():
                 db.session.rollback()
                 print(f"[INFO] is_verified column might already exist: {e}")
 
+    # Move emotion probabilities from the old JSON text column into per-emotion columns
+    if 'diary_entry' in inspector.get_table_names():
+        columns = [col['name'] for col in inspector.get_columns('diary_entry')]
+        for label in EMOTION_LABELS:
+            if f'prob_{label}' not in columns:
+                try:
+                    db.session.execute(text(f'ALTER TABLE diary_entry ADD COLUMN prob_{label} REAL'))
+                    db.session.commit()
+                    print(f"[OK] Added prob_{label} column to diary_entry table")
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"[INFO] prob_{label} column might already exist: {e}")
+
+        if 'emotion_probabilities' in columns:
+            try:
+                rows = db.session.execute(text(
+                    'SELECT id, emotion_probabilities FROM diary_entry WHERE emotion_probabilities IS NOT NULL'
+                )).fetchall()
+                assignments = ', '.join(f'prob_{label} = :{label}' for label in EMOTION_LABELS)
+                for entry_id, raw in rows:
+                    try:
+                        probs = json.loads(raw) if raw else {}
+                    except ValueError:
+                        probs = {}
+                    params = {label: probs.get(label) for label in EMOTION_LABELS}
+                    params['id'] = entry_id
+                    db.session.execute(text(f'UPDATE diary_entry SET {assignments} WHERE id = :id'), params)
+                db.session.execute(text('ALTER TABLE diary_entry DROP COLUMN emotion_probabilities'))
+                db.session.commit()
+                print(f"[OK] Migrated emotion probabilities for {len(rows)} entries")
+            except Exception as e:
+                db.session.rollback()
+                print(f"[INFO] Could not migrate emotion_probabilities column: {e}")
+
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)